@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 import cantools
 from cantools.database import Database
 from cantools.database.can import Message
 
 
+FrameDecoder = Callable[[bytes], Optional[Dict[str, Any]]]
+
+
 class DBCNotLoadedError(RuntimeError):
     """Raised when an operation requires a loaded DBC, but none is available."""
 
@@ -19,11 +22,40 @@ class DBCManager:
         self._dbc_path: Optional[Path] = None
         self._dbc_label: Optional[str] = None
         self._db: Optional[Database] = None
+        self._decoders: Dict[int, FrameDecoder] = {}
+        # Only log decoding needs these two tables, so they are built on first use.
+        self._signal_decoders: Optional[Dict[int, FrameDecoder]] = None
+        self._value_decoders: Optional[Dict[int, FrameDecoder]] = None
 
     @property
     def dbc_path(self) -> Optional[Path]:
         return self._dbc_path
 
+    @property
+    def decoders(self) -> Dict[int, FrameDecoder]:
+        """Per-frame-id decode functions for the active DBC, built once at load time.
+
+        Empty until a DBC is loaded; decoders return ``None`` instead of raising on bad data.
+        """
+        return self._decoders
+
+    @property
+    def signal_decoders(self) -> Dict[int, FrameDecoder]:
+        """Like :attr:`decoders`, but the payload carries only the message name and signals."""
+        if self._signal_decoders is None:
+            self.build_signal_decoders()
+        return self._signal_decoders
+
+    @property
+    def value_decoders(self) -> Dict[int, FrameDecoder]:
+        """Like :attr:`signal_decoders`, but choice signals stay raw numbers instead of labels.
+
+        Messages without value tables share their :attr:`signal_decoders` function.
+        """
+        if self._value_decoders is None:
+            self.build_signal_decoders()
+        return self._value_decoders
+
     def load(self, path: str | Path) -> Dict[str, Any]:
         """Load a DBC file from disk and return its metadata."""
         candidate = Path(path).expanduser().resolve()
@@ -33,6 +65,7 @@ class DBCManager:
         self._db = cantools.database.load_file(candidate)
         self._dbc_path = candidate
         self._dbc_label = candidate.name
+        self._build_decoders()
         return self._build_metadata()
 
     def load_from_content(self, content: bytes, label: Optional[str] = None) -> Dict[str, Any]:
@@ -48,6 +81,7 @@ class DBCManager:
         self._db = cantools.database.load_string(text, database_format="dbc")
         self._dbc_path = None
         self._dbc_label = label
+        self._build_decoders()
         return self._build_metadata()
 
     def is_loaded(self) -> bool:
@@ -104,23 +138,68 @@ class DBCManager:
 
     def decode(self, arbitration_id: int, data: bytes) -> Optional[Dict[str, Any]]:
         """Decode a CAN message if it exists in the active DBC."""
-        db = self._require_db()
-        try:
-            message = db.get_message_by_frame_id(arbitration_id)
-        except KeyError:
+        self._require_db()
+        decoder = self._decoders.get(arbitration_id)
+        if decoder is None:
             return None
+        return decoder(data)
 
-        try:
-            decoded = message.decode(data)
-        except Exception:
-            return None
-
-        return {
-            "name": message.name,
-            "signals": decoded,
-            "is_extended": message.is_extended_frame,
-            "comment": message.comment,
+    def _build_decoders(self) -> None:
+        db = self._require_db()
+        self._decoders = {
+            message.frame_id: self._make_decoder(message, include_metadata=True) for message in db.messages
         }
+        self._signal_decoders = None
+        self._value_decoders = None
+
+    def build_signal_decoders(self) -> None:
+        """Build :attr:`signal_decoders` and :attr:`value_decoders` now instead of on first use."""
+        signal_decoders: Dict[int, FrameDecoder] = {}
+        value_decoders: Dict[int, FrameDecoder] = {}
+        messages = self._db.messages if self._db is not None else []
+        for message in messages:
+            signal_decoder = self._make_decoder(message, include_metadata=False)
+            signal_decoders[message.frame_id] = signal_decoder
+            if any(signal.choices for signal in message.signals):
+                signal_decoder = self._make_decoder(message, include_metadata=False, decode_choices=False)
+            value_decoders[message.frame_id] = signal_decoder
+        self._signal_decoders = signal_decoders
+        self._value_decoders = value_decoders
+
+    @staticmethod
+    def _make_decoder(message: Message, include_metadata: bool, decode_choices: bool = True) -> FrameDecoder:
+        # Bind everything that is constant per message so a decode is a single codec call.
+        # decode_simple goes straight to the bitstruct codec; container frames raise there,
+        # which decode() without decode_containers did as well.
+        decode_signals = message.decode_simple
+        name = message.name
+        is_extended = message.is_extended_frame
+        comment = message.comment
+
+        if not include_metadata:
+
+            def decode_signals_only(data: bytes) -> Optional[Dict[str, Any]]:
+                try:
+                    decoded = decode_signals(data, decode_choices)
+                except Exception:
+                    return None
+                return {"name": name, "signals": decoded}
+
+            return decode_signals_only
+
+        def decode_frame(data: bytes) -> Optional[Dict[str, Any]]:
+            try:
+                decoded = decode_signals(data, decode_choices)
+            except Exception:
+                return None
+            return {
+                "name": name,
+                "signals": decoded,
+                "is_extended": is_extended,
+                "comment": comment,
+            }
+
+        return decode_frame
 
     def _format_signal(self, signal: cantools.database.can.signal.Signal) -> Dict[str, Any]:
         choices = None
@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from cantools.database.can import Message
+
+from .dbc_manager import DBCManager
+
+SignalCatalog = Dict[Tuple[str, str], Dict[str, Any]]
+# Each series carries its points as parallel lists under these keys.
+SERIES_COLUMNS = ("timestamps", "relative", "values")
+SeriesMap = Dict[str, Dict[str, Any]]
+ParsedDBC = Tuple[bytes, DBCManager, SignalCatalog]
+
+# Decoding holds the GIL (cantools wraps each bitstruct call in Python), so threads do not
+# speed it up; large recordings are split across processes instead.
+#
+# Measured per event on 60k events: decoding costs 1.0 us (repeating payloads, served by the
+# payload cache) to 3.1 us (all unique); the parent spends 1.2 us pickling the chunk out and
+# loading the results back, and each worker 0.9 us on its side of that. Starting a forked pool
+# costs about 5 ms once. A pool of N workers therefore only wins when
+# decode > 1.2 + (decode + 0.9) / N, which needs at least three workers even for unique
+# payloads; with one worker the pool was twice as slow as decoding in place. At four workers it
+# saves about 0.9 us per unique-payload event, so the one-off pool start is repaid after ~6k
+# events; the event threshold keeps a margin for recordings whose payloads mostly repeat.
+PARALLEL_MIN_WORKERS = 3
+PARALLEL_MIN_EVENTS = 20000
+WORKER_COUNT = os.cpu_count() or 1
+
+# Forked workers inherit the parent's parsed DBC copy-on-write. Spawn-only platforms
+# (macOS, Windows) re-parse the DBC bytes shipped with each chunk instead.
+_FORK_CONTEXT = multiprocessing.get_context("fork") if sys.platform.startswith("linux") else None
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_digest: Optional[bytes] = None
+# Distinct payloads remembered per decode call. Kept small: in logs of mostly unique payloads a
+# larger cache costs more in allocation and GC than its few hits save.
+PAYLOAD_CACHE_SIZE = 4096
+# Recently parsed DBCs by content digest, least recently used first. Users typically decode
+# several recordings against the same DBC, and parsing dominates small decodes.
+DBC_CACHE_SIZE = 8
+_dbc_cache: "OrderedDict[bytes, Tuple[DBCManager, Dict[str, Any], SignalCatalog]]" = OrderedDict()
+# Decode requests parse DBCs on threadpool threads; the lock guards only the cache bookkeeping.
+_dbc_cache_lock = threading.Lock()
+
+# Parsed DBC for the current process. Set in the parent right before workers fork;
+# workers must treat it as read-only so its pages stay shared.
+_worker_dbc: Optional[ParsedDBC] = None
+
+
+def load_parsed_dbc(
+    contents: bytes, digest: bytes, label: Optional[str]
+) -> Tuple[DBCManager, Dict[str, Any], SignalCatalog]:
+    """Parse DBC ``contents`` into a manager, its metadata and signal catalog, reusing recent parses by digest."""
+    with _dbc_cache_lock:
+        cached = _dbc_cache.get(digest)
+        if cached is not None:
+            _dbc_cache.move_to_end(digest)
+            return cached
+    manager = DBCManager()
+    metadata = manager.load_from_content(contents, label)
+    # Build the decode-side tables now, so decodes and forked workers share one copy.
+    manager.build_signal_decoders()
+    parsed = (manager, metadata, build_signal_catalog(metadata))
+    with _dbc_cache_lock:
+        _dbc_cache[digest] = parsed
+        if len(_dbc_cache) > DBC_CACHE_SIZE:
+            _dbc_cache.popitem(last=False)
+    return parsed
+
+
+def build_signal_catalog(metadata: Dict[str, Any]) -> SignalCatalog:
+    """Index DBC signal metadata by ``(message, signal)`` name."""
+    signal_catalog: SignalCatalog = {}
+    for message in metadata.get("messages", []):
+        for signal in message.get("signals", []):
+            signal_catalog[(message["name"], signal["name"])] = signal
+    return signal_catalog
+
+
+def decode_events(
+    manager: DBCManager,
+    signal_catalog: SignalCatalog,
+    events: List[Dict[str, Any]],
+    started_at: float,
+    max_events: int,
+) -> Tuple[List[Dict[str, Any]], SeriesMap, float]:
+    """Decode recorded events, returning the first ``max_events`` rows, all signal series and the
+    latest event timestamp (``started_at`` if none is later)."""
+    series_map: SeriesMap = {}
+    last_timestamp = started_at
+
+    # Series take raw numbers for choice signals; only table rows of messages with value
+    # tables are decoded a second time to show labels.
+    value_decoders = manager.value_decoders
+    label_decoders = manager.signal_decoders
+    choice_messages = {message for (message, _), signal in signal_catalog.items() if signal.get("choices")}
+    # Series columns by message and signal name, so each decoded signal reaches its series with
+    # one dict lookup instead of formatting its key and probing series_map on every event.
+    message_series: Dict[str, Dict[str, Tuple[List[float], List[float], List[float]]]] = {}
+    # CAN traffic repeats payloads heavily (status frames, slow-moving signals), so each frame's
+    # bytes and decoded values are reused for identical recorded payloads.
+    payload_cache: Dict[Tuple[int, str], Tuple[bytes, Dict[str, Any]]] = {}
+    # Fallback messages by recorded name, resolved once per name (None when the DBC lacks it).
+    named_messages: Dict[str, Optional[Message]] = {}
+
+    # Every event yields one table row, so rows come from exactly the first max_events events
+    # and the row list can be sized up front.
+    row_count = max(0, min(max_events, len(events)))
+    decoded_events: List[Any] = [None] * row_count
+    for index, event in enumerate(events):
+        # Recordings on disk may predate some fields, so keep the defaults but resolve .get once.
+        event_get = event.get
+        event_timestamp = float(event_get("timestamp", started_at))
+        if event_timestamp > last_timestamp:
+            last_timestamp = event_timestamp
+        relative_time = event_timestamp - started_at
+        raw_data = event_get("data", [])
+        frame_id = event_get("id", 0)
+        # Frames are recorded as hex strings; older recordings stored lists of byte values.
+        cache_key = (frame_id, raw_data) if isinstance(raw_data, str) else None
+        cached = payload_cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            data_bytes, decoded_values = cached
+        else:
+            data_bytes = bytes.fromhex(raw_data) if cache_key is not None else bytes(raw_data)
+            decoder = value_decoders.get(frame_id)
+            if decoder is None:
+                decoded_values = _decode_by_name(manager, named_messages, event, data_bytes, decode_choices=False)
+            else:
+                # A known id that fails to decode has a payload its message cannot hold, so there
+                # is no point retrying it under the recorded name.
+                decoded_values = decoder(data_bytes)
+                if decoded_values is not None and cache_key is not None and len(payload_cache) < PAYLOAD_CACHE_SIZE:
+                    payload_cache[cache_key] = (data_bytes, decoded_values)
+
+        if decoded_values:
+            message_name = decoded_values["name"]
+            series_points = message_series.get(message_name)
+            if series_points is None:
+                series_points = message_series[message_name] = {}
+            for signal_name, value in decoded_values["signals"].items():
+                columns = series_points.get(signal_name)
+                if columns is None:
+                    key = f"{message_name}.{signal_name}"
+                    columns = series_points[signal_name] = ([], [], [])
+                    series_map[key] = {
+                        "key": key,
+                        "message": message_name,
+                        "signal": signal_name,
+                        "unit": signal_catalog.get((message_name, signal_name), {}).get("unit"),
+                        "timestamps": columns[0],
+                        "relative": columns[1],
+                        "values": columns[2],
+                    }
+                # Series are decoded without choice labels, so every value is already an int or float.
+                timestamps, relatives, values = columns
+                timestamps.append(event_timestamp)
+                relatives.append(relative_time)
+                values.append(float(value))
+
+        # Series still need every event; past the cap, rows and choice labels are skipped.
+        if index >= row_count:
+            continue
+        decoded_payload = decoded_values
+        if decoded_values is not None and decoded_values["name"] in choice_messages:
+            decoder = label_decoders.get(frame_id)
+            if decoder is None:
+                decoded_payload = _decode_by_name(manager, named_messages, event, data_bytes, decode_choices=True)
+            else:
+                decoded_payload = decoder(data_bytes)
+        decoded_events[index] = {
+            "type": event_get("type"),
+            "timestamp": event_timestamp,
+            "relative_time": relative_time,
+            "id": event_get("id"),
+            "dlc": event_get("dlc"),
+            "data": event_get("data"),
+            "message": event_get("message"),
+            "decoded": decoded_payload,
+            "periodMs": event_get("periodMs"),
+        }
+
+    return decoded_events, series_map, last_timestamp
+
+
+def _decode_by_name(
+    manager: DBCManager,
+    named_messages: Dict[str, Optional[Message]],
+    event: Dict[str, Any],
+    data_bytes: bytes,
+    decode_choices: bool,
+) -> Optional[Dict[str, Any]]:
+    """Fallback for frames whose id is not in the DBC: decode by the recorded message name."""
+    name = event.get("message")
+    if not name:
+        return None
+    if name in named_messages:
+        message_obj = named_messages[name]
+    else:
+        try:
+            message_obj = manager.get_message_by_name(name)
+        except Exception:
+            message_obj = None
+        named_messages[name] = message_obj
+    if message_obj is None:
+        return None
+    try:
+        decoded_signals = message_obj.decode(data_bytes, decode_choices=decode_choices)
+    except Exception:
+        return None
+    return {"name": message_obj.name, "signals": decoded_signals}
+
+
+def build_messages_meta(metadata: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Message-constant fields sent once per response instead of with every decoded event."""
+    return {
+        message["name"]: {"is_extended": message.get("is_extended"), "comment": message.get("comment")}
+        for message in metadata.get("messages", [])
+    }
+
+
+def merge_series(target: SeriesMap, fragment: SeriesMap) -> None:
+    """Append a later chunk's series points onto ``target`` in place."""
+    for key, entry in fragment.items():
+        existing = target.get(key)
+        if existing is None:
+            target[key] = entry
+        else:
+            for column in SERIES_COLUMNS:
+                existing[column].extend(entry[column])
+
+
+def minmax_indices(values: List[float], n_out: int) -> List[int]:
+    """Pick up to ``n_out`` indices: the minimum and maximum of each of ``n_out // 2`` buckets.
+
+    Unlike a fixed stride, this keeps every spike and dip visible in the downsampled chart.
+    """
+    bucket_count = max(1, n_out // 2)
+    bucket_size = len(values) / bucket_count
+    indices: List[int] = []
+    for bucket in range(bucket_count):
+        start = int(bucket * bucket_size)
+        end = int((bucket + 1) * bucket_size)
+        if start >= end:
+            continue
+        window = values[start:end]
+        low = start + window.index(min(window))
+        high = start + window.index(max(window))
+        if low == high:
+            indices.append(low)
+        elif low < high:
+            indices += (low, high)
+        else:
+            indices += (high, low)
+    return indices
+
+
+def downsample_series(series_map: SeriesMap, max_points: int) -> List[Dict[str, Any]]:
+    """Series sorted by key, each reduced to at most ``max_points`` points by per-bucket min/max."""
+    series: List[Dict[str, Any]] = []
+    for key in sorted(series_map):
+        entry = series_map[key]
+        original_count = len(entry["values"])
+        entry["downsampled"] = original_count > max_points
+        entry["original_points"] = original_count
+        if entry["downsampled"]:
+            indices = minmax_indices(entry["values"], max_points)
+            for column in SERIES_COLUMNS:
+                values = entry[column]
+                entry[column] = [values[index] for index in indices]
+        series.append(entry)
+    return series
+
+
+def get_pool(parsed: ParsedDBC) -> ProcessPoolExecutor:
+    """Return a decode worker pool that can decode against ``parsed``.
+
+    With fork, a pool is tied to the DBC its workers inherited; a different DBC gets a
+    fresh pool while the previous one finishes any work it already accepted.
+    """
+    global _pool, _pool_digest, _worker_dbc
+    # A worker that died (e.g. OOM-killed) leaves the executor unusable; start over with a new one.
+    if _pool is not None and _pool._broken:
+        shutdown_pool()
+    if _FORK_CONTEXT is None:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=WORKER_COUNT)
+        return _pool
+
+    if _pool is not None and _pool_digest != parsed[0]:
+        _pool.shutdown(wait=False)
+        _pool = None
+    if _pool is None:
+        # Workers fork on the first submit, which callers do without yielding to the loop.
+        _worker_dbc = parsed
+        _pool = ProcessPoolExecutor(max_workers=WORKER_COUNT, mp_context=_FORK_CONTEXT)
+        _pool_digest = parsed[0]
+    return _pool
+
+
+def pool_ready() -> bool:
+    """No-op task; submitting it makes a new fork pool start its workers right away."""
+    return True
+
+
+def pool_shares_dbc(digest: bytes) -> bool:
+    """Whether the current pool's workers already hold the DBC with ``digest``."""
+    return _FORK_CONTEXT is not None and _pool is not None and _pool_digest == digest
+
+
+def shutdown_pool() -> None:
+    global _pool, _pool_digest
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        _pool_digest = None
+
+
+def split_chunks(events: List[Dict[str, Any]], parts: int) -> List[Tuple[int, List[Dict[str, Any]]]]:
+    """Split ``events`` into at most ``parts`` contiguous ``(offset, chunk)`` slices."""
+    parts = max(1, parts)
+    size = -(-len(events) // parts)
+    return [(offset, events[offset : offset + size]) for offset in range(0, len(events), size)]
+
+
+def decode_chunk(
+    contents: Optional[bytes],
+    digest: bytes,
+    label: Optional[str],
+    events: List[Dict[str, Any]],
+    started_at: float,
+    max_events: int,
+) -> Tuple[List[Dict[str, Any]], SeriesMap, float]:
+    """Worker entry point: decode one chunk, reusing the worker's parsed DBC when unchanged."""
+    global _worker_dbc
+    if _worker_dbc is None or _worker_dbc[0] != digest:
+        if contents is None:
+            raise RuntimeError("DBC content is required when the worker has not inherited it.")
+        manager, _, signal_catalog = load_parsed_dbc(contents, digest, label)
+        _worker_dbc = (digest, manager, signal_catalog)
+    _, manager, signal_catalog = _worker_dbc
+    return decode_events(manager, signal_catalog, events, started_at, max_events)
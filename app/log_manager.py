@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import threading
 import time
 import uuid
@@ -8,6 +7,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
+
 
 @dataclass
 class Recording:
@@ -17,6 +18,8 @@ class Recording:
     name: str
     started_at: float
     events: List[Dict[str, Any]] = field(default_factory=list)
+    # Elapsed time is measured on the monotonic clock so wall-clock adjustments cannot skew it.
+    started_monotonic: float = field(default_factory=time.monotonic)
 
     def to_dict(self, include_events: bool = True) -> Dict[str, Any]:
         data: Dict[str, Any] = {
@@ -63,28 +66,34 @@ class RecordingManager:
             record_data["ended_at"] = ended_at
             record_data["event_count"] = len(record.events)
 
-            path = self._record_path(record.id)
-            with path.open("w", encoding="utf-8") as handle:
-                json.dump(record_data, handle, ensure_ascii=False, indent=2)
+            # orjson encodes in C (json.dump with an indent falls back to its pure-Python encoder)
+            # and writes decoded choice labels as their text instead of failing on them.
+            self._record_path(record.id).write_bytes(
+                orjson.dumps(record_data, default=str, option=orjson.OPT_INDENT_2)
+            )
 
             self._active = None
             return record_data
 
+    def is_recording(self) -> bool:
+        """Cheap unlocked check for the CAN event hot path; append_event re-checks under the lock."""
+        return self._active is not None
+
     def append_event(self, event: Dict[str, Any]) -> None:
-        """Append a CAN event to the active recording."""
+        """Append a CAN event to the active recording; the recording takes ownership of ``event``."""
         with self._lock:
             if self._active is None:
                 return
-            # Events are already JSON serialisable (lists/ints/str/floats).
-            self._active.events.append(dict(event))
+            # Events are built fresh per frame and already JSON serialisable (hex data, ints, floats),
+            # so they are stored as-is rather than copied.
+            self._active.events.append(event)
 
     def list_recordings(self) -> List[Dict[str, Any]]:
         """Return available recordings on disk sorted by newest first."""
         recordings: List[Dict[str, Any]] = []
         for path in sorted(self._base_directory.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True):
             try:
-                with path.open("r", encoding="utf-8") as handle:
-                    data = json.load(handle)
+                data = orjson.loads(path.read_bytes())
             except Exception:
                 continue
             data.setdefault("id", path.stem)
@@ -98,19 +107,25 @@ class RecordingManager:
             recordings.append(data)
         return recordings
 
+    def has_recording(self, record_id: str) -> bool:
+        """Whether a recording with this identifier exists on disk, without loading it."""
+        return self._record_path(record_id).exists()
+
     def get_recording(self, record_id: str) -> Optional[Dict[str, Any]]:
         """Load a recording from disk by identifier."""
         path = self._record_path(record_id)
         if not path.exists():
             return None
-        with path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        return orjson.loads(path.read_bytes())
 
     def get_active(self) -> Optional[Dict[str, Any]]:
+        """Return a fresh summary of the active recording, including its elapsed duration."""
         with self._lock:
             if self._active is None:
                 return None
-            return self._active.to_dict(include_events=False)
+            data = self._active.to_dict(include_events=False)
+            data["duration"] = time.monotonic() - self._active.started_monotonic
+            return data
 
     def _record_path(self, record_id: str) -> Path:
         return self._base_directory / f"{record_id}.json"
@@ -1,29 +1,53 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import io
 import logging
 import math
 import os
+import re
 import sys
 import threading
 import time
 import unicodedata
+from collections import deque
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import redirect_stdout
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Literal
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Literal, Sequence
 
 import openpyxl
-from fastapi import File, FastAPI, HTTPException, Query, UploadFile, WebSocket, WebSocketDisconnect
+import orjson
+from fastapi import File, FastAPI, HTTPException, Query, Request, UploadFile, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 
 from .can_manager import CANManager, CANNotConfiguredError
-from .dbc_manager import DBCManager, DBCNotLoadedError
+from .dbc_manager import DBCManager
+from .log_decoder import (
+    PARALLEL_MIN_EVENTS,
+    PARALLEL_MIN_WORKERS,
+    WORKER_COUNT,
+    build_messages_meta,
+    decode_chunk,
+    decode_events,
+    downsample_series,
+    get_pool,
+    load_parsed_dbc,
+    merge_series,
+    pool_ready,
+    pool_shares_dbc,
+    shutdown_pool,
+    split_chunks,
+)
 from .log_manager import RecordingManager
-from .translations import get_all_translations, get_translation
+from .translations import get_all_translations
 
 try:
     import can
@@ -80,6 +104,23 @@ def _detect_can_interfaces() -> list[Dict[str, Any]]:
     return results
 
 
+# Detection is slow and swaps the process-wide stdout, so it runs one at a time and
+# its result is reused for a short while.
+INTERFACE_CACHE_SECONDS = 2.0
+_interface_cache: Optional[tuple[float, list[Dict[str, Any]]]] = None
+_interface_lock = threading.Lock()
+
+
+def _cached_can_interfaces() -> list[Dict[str, Any]]:
+    global _interface_cache
+    with _interface_lock:
+        if _interface_cache is not None and time.monotonic() - _interface_cache[0] < INTERFACE_CACHE_SECONDS:
+            return _interface_cache[1]
+        interfaces = _detect_can_interfaces()
+        _interface_cache = (time.monotonic(), interfaces)
+        return interfaces
+
+
 class FaultInjectionManager:
     """Manages fault injection testing for CAN messages."""
 
@@ -422,6 +463,7 @@ class SignalChaserManager:
     ) -> None:
         self._dbc_manager = dbc_manager
         self._can_manager = can_manager
+        # Scans run as asyncio tasks on the server's event loop, so start() must be called from it.
         self._tasks: Dict[str, Dict[str, Any]] = {}
         self._lock = threading.Lock()
         self._notifier: Optional[Callable[[str, Dict[str, Any]], None]] = None
@@ -435,7 +477,7 @@ class SignalChaserManager:
         interval_seconds: float,
         *,
         mode: str = "signals",
-        codes: Optional[List[int]] = None,
+        codes: Optional[Sequence[int]] = None,
         source: Optional[str] = None,
         descriptions: Optional[Dict[int, str]] = None,
         target_signal: Optional[str] = None,
@@ -484,7 +526,6 @@ class SignalChaserManager:
         if not status.get("configured"):
             raise RuntimeError("Önce CAN arayüzünü yapılandırın.")
 
-        stop_event = threading.Event()
         started_at = time.time()
         info: Dict[str, Any] = {
             "messageName": message_name,
@@ -497,28 +538,28 @@ class SignalChaserManager:
             "currentIndex": None,
         }
 
-        thread = threading.Thread(
-            target=self._run_signal_scan,
-            args=(message_name, signals, interval_seconds, stop_event),
+        # Signal bounds do not change during a scan, so each tick only copies the baseline payload.
+        min_payload: Dict[str, float] = {signal.name: self._min_value(signal) for signal in signals}
+        max_values: List[float] = [self._max_value(signal) for signal in signals]
+
+        task = asyncio.get_running_loop().create_task(
+            self._run_signal_scan(message_name, signals, min_payload, max_values, interval_seconds),
             name=f"signal-chaser-{message_name}",
-            daemon=True,
         )
 
         with self._lock:
             self._tasks[message_name] = {
-                "thread": thread,
-                "stop": stop_event,
+                "task": task,
                 "info": info,
             }
 
-        thread.start()
         return info.copy()
 
     def _start_code_scan(
         self,
         message_name: str,
         interval_seconds: float,
-        codes: List[int],
+        codes: Sequence[int],
         *,
         source: Optional[str] = None,
         descriptions: Optional[Dict[int, str]] = None,
@@ -535,21 +576,42 @@ class SignalChaserManager:
         if len(codes) > self.MAX_CODES:
             raise ValueError(f"En fazla {self.MAX_CODES} hata kodu gönderilebilir.")
 
-        filtered_codes = [code for code in codes if code is not None]
+        # A code range has no missing entries to filter out.
+        filtered_codes = codes if isinstance(codes, range) else [code for code in codes if code is not None]
         if not filtered_codes:
             raise ValueError("Geçerli hata kodu bulunamadı.")
 
-        stop_event = threading.Event()
         started_at = time.time()
         byte_length = int(message.length or 8)
         if byte_length <= 0:
             byte_length = 8
+        format_code = self._code_formatter(byte_length * 2)
         code_lookup: Dict[int, str] = {}
         if descriptions:
             for code, text in descriptions.items():
                 if isinstance(code, int) and isinstance(text, str):
                     code_lookup[code] = text.strip()
 
+        # Every frame of the scan is known up front, so each is encoded once here and the
+        # loop only cycles through the ring. Codes that do not fit the message are skipped.
+        encoded_ring: List[Optional[Dict[str, Any]]] = []
+        can_messages: List[Optional[can.Message]] = []
+        for code in filtered_codes:
+            try:
+                encoded = self._encode_code_payload(message, code, byte_length)
+            except ValueError as exc:
+                logger.warning("Hata kodu %s atlanıyor: %s", code, exc)
+                encoded_ring.append(None)
+                can_messages.append(None)
+                continue
+            encoded["code"] = code
+            encoded["mode"] = "codes"
+            description = code_lookup.get(code)
+            if description:
+                encoded["description"] = description
+            encoded_ring.append(encoded)
+            can_messages.append(_build_can_message(encoded))
+
         info: Dict[str, Any] = {
             "messageName": message_name,
             "intervalSeconds": interval_seconds,
@@ -557,7 +619,7 @@ class SignalChaserManager:
             "mode": "codes",
             "codeSource": source,
             "codeCount": len(filtered_codes),
-            "codePreview": [self._format_code(code, byte_length * 2) for code in filtered_codes[:5]],
+            "codePreview": [format_code(code) for code in filtered_codes[:5]],
             "codeHexWidth": byte_length * 2,
             "currentSignal": None,
             "currentCode": None,
@@ -566,40 +628,29 @@ class SignalChaserManager:
         }
         if code_lookup:
             info["codeDescriptions"] = {
-                self._format_code(code, byte_length * 2): text for code, text in code_lookup.items()
+                format_code(code): text for code, text in code_lookup.items()
             }
             info["codeDescriptionsCount"] = len(code_lookup)
 
-        thread = threading.Thread(
-            target=self._run_code_scan,
-            args=(
-                message_name,
-                message,
-                tuple(filtered_codes),
-                interval_seconds,
-                stop_event,
-                code_lookup,
-            ),
+        task = asyncio.get_running_loop().create_task(
+            self._run_code_scan(message_name, encoded_ring, can_messages, format_code, interval_seconds),
             name=f"code-chaser-{message_name}",
-            daemon=True,
         )
 
         with self._lock:
             self._tasks[message_name] = {
-                "thread": thread,
-                "stop": stop_event,
+                "task": task,
                 "info": info,
                 "descriptions": code_lookup,
             }
 
-        thread.start()
         return info.copy()
 
     def _start_code_scan_decimal(
         self,
         message_name: str,
         interval_seconds: float,
-        codes: List[int],
+        codes: Sequence[int],
         target_signal: str,
         *,
         source: Optional[str] = None,
@@ -623,11 +674,11 @@ class SignalChaserManager:
         if len(codes) > self.MAX_CODES:
             raise ValueError(f"En fazla {self.MAX_CODES} hata kodu gönderilebilir.")
 
-        filtered_codes = [code for code in codes if code is not None]
+        # A code range has no missing entries to filter out.
+        filtered_codes = codes if isinstance(codes, range) else [code for code in codes if code is not None]
         if not filtered_codes:
             raise ValueError("Geçerli hata kodu bulunamadı.")
 
-        stop_event = threading.Event()
         started_at = time.time()
         code_lookup: Dict[int, str] = {}
         if descriptions:
@@ -643,7 +694,7 @@ class SignalChaserManager:
             "codeSource": source,
             "targetSignal": target_signal,
             "codeCount": len(filtered_codes),
-            "codePreview": filtered_codes[:5],
+            "codePreview": list(filtered_codes[:5]),
             "currentSignal": target_signal,
             "currentCode": None,
             "currentIndex": None,
@@ -653,30 +704,25 @@ class SignalChaserManager:
             info["codeDescriptions"] = code_lookup
             info["codeDescriptionsCount"] = len(code_lookup)
 
-        thread = threading.Thread(
-            target=self._run_code_scan_decimal,
-            args=(
+        task = asyncio.get_running_loop().create_task(
+            self._run_code_scan_decimal(
                 message_name,
                 message,
                 tuple(filtered_codes),
                 target_signal,
                 interval_seconds,
-                stop_event,
                 code_lookup,
             ),
             name=f"code-decimal-chaser-{message_name}",
-            daemon=True,
         )
 
         with self._lock:
             self._tasks[message_name] = {
-                "thread": thread,
-                "stop": stop_event,
+                "task": task,
                 "info": info,
                 "descriptions": code_lookup,
             }
 
-        thread.start()
         return info.copy()
 
     def stop(self, message_name: str) -> Dict[str, Any]:
@@ -684,15 +730,10 @@ class SignalChaserManager:
             task = self._tasks.get(message_name)
             if not task:
                 raise RuntimeError("Bu mesaj için aktif sinyal taraması yok.")
-            stop_event: threading.Event = task["stop"]
             info = task["info"].copy()
-
-        stop_event.set()
-        task["thread"].join(timeout=1.0)
-
-        with self._lock:
             self._tasks.pop(message_name, None)
 
+        task["task"].cancel()
         return info
 
     def get_status(self) -> List[Dict[str, Any]]:
@@ -706,116 +747,106 @@ class SignalChaserManager:
             except RuntimeError:
                 continue
 
-    def _run_signal_scan(
+    async def _run_signal_scan(
         self,
         message_name: str,
         signals: List[Any],
+        min_payload: Dict[str, float],
+        max_values: List[float],
         interval_seconds: float,
-        stop_event: threading.Event,
     ) -> None:
         index = 0
         signal_count = len(signals)
+        deadline = time.perf_counter()
 
-        while not stop_event.is_set():
-            payload: Dict[str, Any] = {}
-            for signal in signals:
-                payload[signal.name] = self._min_value(signal)
-
+        while True:
+            payload: Dict[str, Any] = min_payload.copy()
             current_signal = signals[index]
-            payload[current_signal.name] = self._max_value(current_signal)
+            payload[current_signal.name] = max_values[index]
 
             try:
                 encoded = self._dbc_manager.encode(message_name, payload)
-                self._send(message_name, encoded, mode="signals")
+                await self._send(message_name, encoded, mode="signals")
                 self._update_current_signal(message_name, current_signal.name)
             except Exception as exc:  # pragma: no cover - runtime safety
                 logger.exception("Sinyal taraması gönderim hatası: %s", exc)
 
-            if stop_event.wait(interval_seconds):
-                break
+            deadline = await self._wait_next_tick(deadline, interval_seconds)
             index = (index + 1) % signal_count
 
-        self._update_current_signal(message_name, None)
-
-    def _run_code_scan(
+    async def _run_code_scan(
         self,
         message_name: str,
-        message: Any,
-        codes: tuple[int, ...],
+        encoded_ring: List[Optional[Dict[str, Any]]],
+        can_messages: List[Optional[can.Message]],
+        format_code: Callable[[int], str],
         interval_seconds: float,
-        stop_event: threading.Event,
-        descriptions: Dict[int, str],
     ) -> None:
         index = 0
-        code_count = len(codes)
-        byte_length = int(message.length or 8)
-        if byte_length <= 0:
-            byte_length = 8
-
-        while not stop_event.is_set():
-            code = codes[index]
-            description = descriptions.get(code) if descriptions else None
+        code_count = len(encoded_ring)
+        deadline = time.perf_counter()
 
-            try:
-                encoded = self._encode_code_payload(message, code, byte_length)
-                encoded["code"] = code
-                if description:
-                    encoded["description"] = description
-                self._send(message_name, encoded, mode="codes")
-                self._update_current_code(message_name, code, index, byte_length * 2, description)
-            except Exception as exc:  # pragma: no cover - runtime safety
-                logger.exception("Hata kodu taraması gönderim hatası: %s", exc)
+        while True:
+            encoded = encoded_ring[index]
+            if encoded is not None:
+                try:
+                    await self._dispatch(message_name, can_messages[index], encoded)
+                    self._update_current_code(message_name, encoded["code"], index, format_code, encoded.get("description"))
+                except Exception as exc:  # pragma: no cover - runtime safety
+                    logger.exception("Hata kodu taraması gönderim hatası: %s", exc)
 
-            if stop_event.wait(interval_seconds):
-                break
+            deadline = await self._wait_next_tick(deadline, interval_seconds)
             index = (index + 1) % code_count
 
-        self._update_current_code(message_name, None, None, byte_length * 2, None)
-
-    def _run_code_scan_decimal(
+    async def _run_code_scan_decimal(
         self,
         message_name: str,
         message: Any,
         codes: tuple[int, ...],
         target_signal: str,
         interval_seconds: float,
-        stop_event: threading.Event,
         descriptions: Dict[int, str],
     ) -> None:
         """Run code scan by assigning decimal values to a specific signal."""
         index = 0
         code_count = len(codes)
+        deadline = time.perf_counter()
+        min_payload: Dict[str, Any] = {signal.name: self._min_value(signal) for signal in message.signals}
 
-        while not stop_event.is_set():
+        while True:
             code = codes[index]
             description = descriptions.get(code) if descriptions else None
 
             try:
                 # Build signal payload: set target signal to decimal code value
                 # All other signals set to their minimum or initial values
-                signal_values: Dict[str, Any] = {}
-                for signal in message.signals:
-                    if signal.name == target_signal:
-                        signal_values[signal.name] = code
-                    else:
-                        signal_values[signal.name] = self._min_value(signal)
+                signal_values: Dict[str, Any] = min_payload.copy()
+                signal_values[target_signal] = code
 
                 # Encode using DBC
                 encoded = self._dbc_manager.encode(message_name, signal_values)
                 encoded["code"] = code
                 if description:
                     encoded["description"] = description
-                self._send(message_name, encoded, mode="codes")
-                # Use hex width of 1 for decimal display (just show as decimal number)
-                self._update_current_code(message_name, code, index, 1, description)
+                await self._send(message_name, encoded, mode="codes")
+                # Decimal codes are displayed as plain numbers
+                self._update_current_code(message_name, code, index, str, description)
             except Exception as exc:  # pragma: no cover - runtime safety
                 logger.exception("Hata kodu decimal taraması gönderim hatası: %s", exc)
 
-            if stop_event.wait(interval_seconds):
-                break
+            deadline = await self._wait_next_tick(deadline, interval_seconds)
             index = (index + 1) % code_count
 
-        self._update_current_code(message_name, None, None, 1, None)
+    @staticmethod
+    async def _wait_next_tick(deadline: float, interval_seconds: float) -> float:
+        """Sleep until one interval after ``deadline`` so send time does not stretch the period."""
+        deadline += interval_seconds
+        remaining = deadline - time.perf_counter()
+        if remaining < -interval_seconds:
+            # After a stall longer than a whole period, restart the schedule instead of bursting.
+            deadline = time.perf_counter()
+        await asyncio.sleep(max(0.0, remaining))
+        return deadline
 
     def _encode_code_payload(self, message: Any, code: int, byte_length: int) -> Dict[str, Any]:
         if code < 0:
@@ -833,14 +864,15 @@ class SignalChaserManager:
             "dlc": byte_length,
         }
 
-    def _send(self, message_name: str, encoded: Dict[str, Any], *, mode: str) -> None:
-        message = _build_can_message(encoded)
-        self._can_manager.send(message)
+    async def _send(self, message_name: str, encoded: Dict[str, Any], *, mode: str) -> None:
+        payload = dict(encoded)
+        payload.setdefault("mode", mode)
+        await self._dispatch(message_name, _build_can_message(encoded), payload)
+
+    async def _dispatch(self, message_name: str, message: can.Message, payload: Dict[str, Any]) -> None:
+        # Bus writes can block when the interface's transmit queue is full, so keep them off the loop.
+        await asyncio.get_running_loop().run_in_executor(None, self._can_manager.send, message)
         if self._notifier:
-            payload = dict(encoded)
-            payload.setdefault("mode", mode)
-            if "description" in encoded:
-                payload["description"] = encoded["description"]
             self._notifier(message_name, payload)
 
     def _update_current_signal(self, message_name: str, signal_name: Optional[str]) -> None:
@@ -859,7 +891,7 @@ class SignalChaserManager:
         message_name: str,
         code_value: Optional[int],
         index: Optional[int],
-        hex_width: int,
+        format_code: Callable[[int], str],
         description: Optional[str],
     ) -> None:
         with self._lock:
@@ -871,7 +903,7 @@ class SignalChaserManager:
             if code_value is None:
                 info["currentCode"] = None
             else:
-                info["currentCode"] = self._format_code(code_value, hex_width)
+                info["currentCode"] = format_code(code_value)
                 info["lastSentAt"] = time.time()
             info["currentDescription"] = description
             if code_value is None:
@@ -913,27 +945,83 @@ class SignalChaserManager:
         return 1.0
 
     @staticmethod
-    def _format_code(code: int, hex_width: int) -> str:
-        # If hex_width is 1, format as decimal (for decimal mode)
-        if hex_width == 1:
-            return str(code)
-        # Otherwise format as hex
+    def _code_formatter(hex_width: int) -> Callable[[int], str]:
+        # Built once per scan so each tick skips parsing a dynamic-width format spec
         width = max(2, hex_width)
-        return f"0x{code:0{width}X}"
+        return ("0x{:0" + str(width) + "X}").format
+
+
+def _json_default(value: Any) -> Any:
+    # Decoded choice signals are cantools NamedSignalValue objects; send their label.
+    return str(value)
+
+
+def _dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class AppJSONResponse(ORJSONResponse):
+    """Serialises straight from native types with orjson, skipping FastAPI's jsonable_encoder pass."""
+
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
+
+_FRAME_EVENT_TYPES = frozenset({"rx", "tx"})
+
+
+def _columnar_batch(batch: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Batch of CAN frame events as one list per field, so field names are sent once.
+
+    Fields missing from an event are ``None``. Returns ``None`` when other event types are mixed in.
+    """
+    fields: Dict[str, Any] = {}
+    for message in batch:
+        if message.get("type") not in _FRAME_EVENT_TYPES:
+            return None
+        fields.update(message)
+    return {
+        "type": "batch",
+        "count": len(batch),
+        "columns": {field: [message.get(field) for message in batch] for field in fields},
+    }
+
+
+DROP_WARNING_INTERVAL_SECONDS = 5.0
+
+
 class MessageBroadcaster:
     """Tracks websocket connections and sends events to all clients."""
 
-    def __init__(self, buffer_delay_seconds: float = 0.1) -> None:
-        self._connections: set[WebSocket] = set()
-        self._lock = asyncio.Lock()
+    def __init__(
+        self,
+        buffer_delay_seconds: float = 0.005,
+        max_batch_size: int = 64,
+        max_pending: int = 10000,
+    ) -> None:
+        # Replaced rather than mutated, so broadcasts can send to a snapshot without locking.
+        # All updates run on the event loop without awaiting mid-update.
+        self._connections: frozenset[WebSocket] = frozenset()
         self._loop: Optional[asyncio.AbstractEventLoop] = None
-        self._queue: Optional[asyncio.Queue[Dict[str, Any]]] = None
+        # Oldest events are dropped once max_pending is reached so a stalled loop cannot grow memory.
+        self._pending: deque[Dict[str, Any]] = deque(maxlen=max_pending)
+        self._pending_lock = threading.Lock()
+        # Overflow drops are counted and logged at most once per DROP_WARNING_INTERVAL_SECONDS;
+        # every drop is reported eventually, batched into the next warning.
+        self._dropped = 0
+        self._last_drop_warning = -DROP_WARNING_INTERVAL_SECONDS
+        self._wake: Optional[asyncio.Event] = None
+        self._wake_scheduled = False
+        self._batch_full: Optional[asyncio.Event] = None
+        self._batch_full_scheduled = False
         self._broadcast_task: Optional[asyncio.Task[None]] = None
         self._buffer_delay_seconds = buffer_delay_seconds
+        self._max_batch_size = max_batch_size
 
     def set_loop(self, loop: asyncio.AbstractEventLoop) -> None:
         self._loop = loop
-        self._queue = asyncio.Queue()
+        self._wake = asyncio.Event()
+        self._batch_full = asyncio.Event()
         self._broadcast_task = loop.create_task(self._broadcast_loop())
 
     async def shutdown(self) -> None:
@@ -944,36 +1032,75 @@ class MessageBroadcaster:
             except asyncio.CancelledError:
                 pass
         # Send any remaining messages
-        if self._queue and not self._queue.empty():
-            batch = []
-            while not self._queue.empty():
-                batch.append(self._queue.get_nowait())
-            if batch:
-                await self.broadcast(batch)
+        while True:
+            batch = self._drain()
+            if not batch:
+                break
+            await self.broadcast(batch)
+        self._report_drops(force=True)
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        with self._pending_lock:
+            if len(self._pending) <= self._max_batch_size:
+                # Common case: everything queued fits one batch, so take it without per-item pops.
+                batch = list(self._pending)
+                self._pending.clear()
+            else:
+                batch = [self._pending.popleft() for _ in range(self._max_batch_size)]
+            if not self._pending and self._wake is not None:
+                self._wake.clear()
+                self._wake_scheduled = False
+            if len(self._pending) < self._max_batch_size and self._batch_full is not None:
+                self._batch_full.clear()
+                self._batch_full_scheduled = False
+            return batch
 
     async def _broadcast_loop(self) -> None:
+        assert self._wake is not None and self._batch_full is not None
         while True:
             try:
-                await asyncio.sleep(self._buffer_delay_seconds)
-                if self._queue and not self._queue.empty():
-                    batch = []
-                    while not self._queue.empty():
-                        batch.append(self._queue.get_nowait())
-                    if batch:
-                        await self.broadcast(batch)
+                if self._dropped:
+                    # Wake up to report outstanding drops even if no further events arrive.
+                    delay = self._last_drop_warning + DROP_WARNING_INTERVAL_SECONDS - time.monotonic()
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), max(0.0, delay))
+                    except asyncio.TimeoutError:
+                        self._report_drops()
+                        continue
+                else:
+                    await self._wake.wait()
+                # Flush after the buffer window or as soon as a full batch is queued, whichever is first.
+                if len(self._pending) < self._max_batch_size:
+                    try:
+                        await asyncio.wait_for(self._batch_full.wait(), self._buffer_delay_seconds)
+                    except asyncio.TimeoutError:
+                        pass
+                await self.broadcast(self._drain())
+                self._report_drops()
             except asyncio.CancelledError:
                 break
             except Exception:
                 logger.exception("Error in broadcast loop")
 
+    def _report_drops(self, force: bool = False) -> None:
+        now = time.monotonic()
+        with self._pending_lock:
+            if not self._dropped or (not force and now - self._last_drop_warning < DROP_WARNING_INTERVAL_SECONDS):
+                return
+            dropped, self._dropped = self._dropped, 0
+            self._last_drop_warning = now
+        logger.warning("Broadcaster queue was full, dropped %d oldest payload(s).", dropped)
+
+    def has_clients(self) -> bool:
+        """Whether any websocket is connected; safe to call from CAN callback threads."""
+        return bool(self._connections)
+
     async def connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
-        async with self._lock:
-            self._connections.add(websocket)
+        self._connections = self._connections | {websocket}
 
     async def disconnect(self, websocket: WebSocket) -> None:
-        async with self._lock:
-            self._connections.discard(websocket)
+        self._connections = self._connections - {websocket}
 
     async def broadcast(self, batch: List[Dict[str, Any]]) -> None:
         if not batch:
@@ -983,26 +1110,46 @@ class MessageBroadcaster:
         if len(batch) == 1:
             payload = batch[0]
         else:
-            payload = {"type": "batch", "messages": batch}
+            payload = _columnar_batch(batch) or {"type": "batch", "messages": batch}
+        # Encoded once and sent as a binary frame so the server does not re-encode text per client.
+        message = _dumps(payload)
 
-        async with self._lock:
-            dead: list[WebSocket] = []
-            for connection in self._connections:
-                try:
-                    await connection.send_json(payload)
-                except Exception:
-                    dead.append(connection)
-            for connection in dead:
-                self._connections.discard(connection)
+        connections = list(self._connections)
+        if not connections:
+            return
+
+        # Send concurrently so one slow client does not hold up the others.
+        results = await asyncio.gather(
+            *(connection.send_bytes(message) for connection in connections),
+            return_exceptions=True,
+        )
+        dead = [connection for connection, result in zip(connections, results) if isinstance(result, BaseException)]
+        if dead:
+            self._connections = self._connections.difference(dead)
 
     def send_threadsafe(self, payload: Dict[str, Any]) -> None:
-        if self._queue is None:
+        loop = self._loop
+        if loop is None or self._wake is None or self._batch_full is None:
             logger.debug("No event loop set for broadcaster, dropping payload")
             return
+        # Only the idle->pending and pending->full transitions need to reach the loop.
+        signals: list[Callable[[], None]] = []
+        with self._pending_lock:
+            if len(self._pending) == self._pending.maxlen:
+                # Counted here, logged by the broadcast loop.
+                self._dropped += 1
+            self._pending.append(payload)
+            if not self._wake_scheduled:
+                self._wake_scheduled = True
+                signals.append(self._wake.set)
+            if not self._batch_full_scheduled and len(self._pending) >= self._max_batch_size:
+                self._batch_full_scheduled = True
+                signals.append(self._batch_full.set)
         try:
-            self._queue.put_nowait(payload)
-        except asyncio.QueueFull:
-            logger.warning("Broadcaster queue is full, dropping payload.")
+            for signal in signals:
+                loop.call_soon_threadsafe(signal)
+        except RuntimeError:
+            logger.debug("Broadcaster event loop is closed, dropping payload")
 
 
 app = FastAPI(title="CAN Bus Tester", version="1.0.0")
@@ -1042,18 +1189,60 @@ class ConfigureInterfaceRequest(BaseModel):
     kwargs: Dict[str, Any] = Field(default_factory=dict)
 
 
-class MessageSendRequest(BaseModel):
-    message_name: str = Field(alias="messageName")
+# Integer strings as Pydantic's lax mode accepts them: optional sign, "_" separators, ".0" suffix.
+_LAX_INT_PATTERN = re.compile(r"[+-]?[0-9](?:_?[0-9])*(?:\.0*)?")
+
+
+def _lax_int(value: Any) -> Optional[int]:
+    """Coerce ``value`` to int the way the former Pydantic model did, or return ``None``."""
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else None
+    if isinstance(value, str):
+        text = value.strip()
+        if _LAX_INT_PATTERN.fullmatch(text):
+            return int(text.partition(".")[0])
+    return None
+
+
+@dataclass
+class MessageSendRequest:
+    """Body of ``/api/messages/send``, parsed without Pydantic since it is hit at TX cadence."""
+
+    message_name: str
     signals: Dict[str, Any]
-    period_ms: Optional[int] = Field(default=None, alias="periodMs", gt=0)
-    task_key: Optional[str] = Field(default=None, alias="taskKey")
-
-    @validator("task_key", always=True)
-    def default_task_key(cls, value: Optional[str], values: Dict[str, Any]) -> Optional[str]:
-        period = values.get("period_ms")
-        if period and not value:
-            return values.get("message_name")
-        return value
+    period_ms: Optional[int] = None
+    task_key: Optional[str] = None
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> "MessageSendRequest":
+        if not isinstance(payload, dict):
+            raise ValueError("Request body must be a JSON object.")
+
+        message_name = payload.get("messageName")
+        if not isinstance(message_name, str):
+            raise ValueError("messageName must be a string.")
+
+        signals = payload.get("signals")
+        if not isinstance(signals, dict):
+            raise ValueError("signals must be an object.")
+
+        period_ms = payload.get("periodMs")
+        if period_ms is not None:
+            period_ms = _lax_int(period_ms)
+            if period_ms is None:
+                raise ValueError("periodMs must be an integer.")
+            if period_ms <= 0:
+                raise ValueError("periodMs must be greater than 0.")
+
+        task_key = payload.get("taskKey")
+        if task_key is not None and not isinstance(task_key, str):
+            raise ValueError("taskKey must be a string.")
+        if period_ms and not task_key:
+            task_key = message_name
+
+        return cls(message_name=message_name, signals=signals, period_ms=period_ms, task_key=task_key)
 
 
 class StopTaskRequest(BaseModel):
@@ -1104,6 +1293,10 @@ def _build_can_message(encoded: Dict[str, Any]) -> can.Message:
     )
 
 
+# Hex code with optional 0x prefix, trailing h suffix and _ separators (spaces are removed first).
+_CODE_PATTERN = re.compile(r"(?:0[xX])?([0-9A-Fa-f_]+?)[hH]?")
+
+
 def _parse_code_value(raw: Any) -> int:
     if raw is None:
         raise ValueError("Boş değer.")
@@ -1124,24 +1317,14 @@ def _parse_code_value(raw: Any) -> int:
     text = str(raw).strip()
     if not text:
         raise ValueError("Boş değer.")
-    cleaned = text.replace(" ", "")
-    if cleaned.lower().startswith("0x"):
-        cleaned = cleaned[2:]
-    if cleaned.endswith(("h", "H")):
-        cleaned = cleaned[:-1]
-    cleaned = cleaned.replace("_", "")
-
-    try:
-        value = int(cleaned, 16)
-    except ValueError as exc:
-        try:
-            value = int(cleaned, 10)
-        except ValueError as second_exc:
-            raise ValueError(f"'{text}' değeri hata koduna dönüştürülemedi.") from second_exc
-
-    if value < 0:
+    if text.startswith("-"):
         raise ValueError("Hata kodu negatif olamaz.")
-    return value
+
+    match = _CODE_PATTERN.fullmatch(text.replace(" ", ""))
+    digits = match.group(1).replace("_", "") if match else ""
+    if not digits:
+        raise ValueError(f"'{text}' değeri hata koduna dönüştürülemedi.")
+    return int(digits, 16)
 
 
 def _handle_tx_event(
@@ -1150,6 +1333,10 @@ def _handle_tx_event(
     task_key: Optional[str] = None,
     period_ms: Optional[int] = None,
 ) -> None:
+    listening = broadcaster.has_clients()
+    recording = recording_manager.is_recording()
+    if not listening and not recording:
+        return
     timestamp = time.time()
     payload = {
         "type": "tx",
@@ -1158,7 +1345,7 @@ def _handle_tx_event(
         "periodMs": period_ms,
         "id": encoded["arbitration_id"],
         "dlc": encoded["dlc"],
-        "data": list(encoded["data"]),
+        "data": encoded["data"].hex(),
         "timestamp": timestamp,
     }
     mode = encoded.get("mode")
@@ -1170,8 +1357,10 @@ def _handle_tx_event(
     description = encoded.get("description")
     if description:
         payload["description"] = description
-    broadcaster.send_threadsafe(payload)
-    recording_manager.append_event(payload)
+    if listening:
+        broadcaster.send_threadsafe(payload)
+    if recording:
+        recording_manager.append_event(payload)
 
 
 signal_chaser.set_notifier(_handle_tx_event)
@@ -1185,7 +1374,7 @@ def _handle_fault_event(message_name: str, event_type: str, data: Dict[str, Any]
             "message": message_name,
             "id": data["arbitration_id"],
             "dlc": data["dlc"],
-            "data": list(data["data"]),
+            "data": data["data"].hex(),
             "timestamp": timestamp,
             "faultType": data.get("faultType"),
             "faultInfo": data.get("faultInfo"),
@@ -1200,23 +1389,29 @@ fault_injection.set_notifier(_handle_fault_event)
 
 
 def _on_can_message(message: can.Message) -> None:
+    # Nothing to build when no UI is connected and nothing is being recorded.
+    listening = broadcaster.has_clients()
+    recording = recording_manager.is_recording()
+    if not listening and not recording:
+        return
     payload: Dict[str, Any] = {
         "type": "rx",
         "id": message.arbitration_id,
         "timestamp": message.timestamp if message.timestamp else time.time(),
         "is_extended": message.is_extended_id,
         "dlc": message.dlc,
-        "data": list(message.data),
+        "data": message.data.hex(),
     }
-    if dbc_manager.is_loaded():
-        try:
-            decoded = dbc_manager.decode(message.arbitration_id, message.data)
-        except DBCNotLoadedError:
-            decoded = None
+    # The decoder table is empty until a DBC is loaded, so this also covers the not-loaded case.
+    decoder = dbc_manager.decoders.get(message.arbitration_id)
+    if decoder is not None:
+        decoded = decoder(message.data)
         if decoded:
             payload["decoded"] = decoded
-    broadcaster.send_threadsafe(payload)
-    recording_manager.append_event(payload)
+    if listening:
+        broadcaster.send_threadsafe(payload)
+    if recording:
+        recording_manager.append_event(payload)
 
 
 can_manager.register_callback(_on_can_message)
@@ -1234,6 +1429,7 @@ async def on_shutdown() -> None:
     can_manager.shutdown()
     signal_chaser.stop_all()
     fault_injection.stop_all()
+    shutdown_pool()
 
 
 @app.get("/")
@@ -1246,16 +1442,21 @@ async def playback() -> FileResponse:
     return FileResponse(str(PLAYBACK_FILE))
 
 
+@lru_cache(maxsize=8)
+def _translations_body(lang: str) -> bytes:
+    # Translation tables are read-only, so each language's response is serialised once.
+    return _dumps({"language": lang, "translations": dict(get_all_translations(lang))})
+
+
 @app.get("/api/translations/{lang}")
-async def get_translations(lang: str) -> Dict[str, Any]:
+async def get_translations(lang: str) -> Response:
     """Get all translations for a specific language."""
-    translations = get_all_translations(lang)
-    return {"language": lang, "translations": translations}
+    return Response(_translations_body(lang), media_type="application/json")
 
 
 @app.get("/api/interface/available")
 async def get_available_interfaces() -> Dict[str, Any]:
-    interfaces = _detect_can_interfaces()
+    interfaces = await run_in_threadpool(_cached_can_interfaces)
     return {"interfaces": interfaces}
 
 
@@ -1312,20 +1513,34 @@ async def get_signal_chaser_status(message_name: Optional[str] = Query(default=N
     return {"tasks": tasks}
 
 
-@app.post("/api/messages/chaser/codes/upload")
-async def upload_chaser_codes(file: UploadFile = File(...)) -> Dict[str, Any]:
-    contents = await file.read()
-    if not contents:
-        raise HTTPException(status_code=400, detail="Excel dosyası boş olamaz.")
+def _read_code_sheet(contents: bytes) -> tuple[List[int], Dict[int, str], int]:
+    """Read error codes and optional descriptions from the active sheet of an Excel file.
 
+    The workbook is opened in read-only mode. Rows up to the header are scanned for the
+    code/description columns; data rows are then streamed limited to those columns.
+    """
     try:
-        workbook = openpyxl.load_workbook(io.BytesIO(contents), data_only=True)
+        workbook = openpyxl.load_workbook(io.BytesIO(contents), data_only=True, read_only=True)
     except Exception as exc:
         logger.exception("Excel dosyası okunamadı: %s", exc)
         raise HTTPException(status_code=400, detail="Excel dosyası okunamadı.")
 
-    sheet = workbook.active
-    header_aliases = {
+    try:
+        return _extract_codes(workbook.active)
+    finally:
+        workbook.close()
+
+
+@lru_cache(maxsize=1024)
+def _normalise_header(value: str) -> str:
+    compact = " ".join(value.strip().split())
+    normalized = unicodedata.normalize("NFKD", compact).lower()
+    return "".join(ch for ch in normalized if ch.isalnum())
+
+
+_CODE_HEADER_ALIASES = frozenset(
+    _normalise_header(alias)
+    for alias in (
         "hata kodları (hex)",
         "hata kodları hex",
         "hata kodları",
@@ -1336,19 +1551,11 @@ async def upload_chaser_codes(file: UploadFile = File(...)) -> Dict[str, Any]:
         "error codes",
         "errorcodes(hex)",
         "errorcodes",
-    }
-
-    def _normalise_header(value: str) -> str:
-        compact = " ".join(value.strip().split())
-        normalized = unicodedata.normalize("NFKD", compact).lower()
-        return "".join(ch for ch in normalized if ch.isalnum())
-
-    normalised_aliases = {_normalise_header(alias) for alias in header_aliases}
-
-    target_column: Optional[int] = None
-    header_row_index: Optional[int] = None
-    description_column: Optional[int] = None
-    description_headers = {
+    )
+)
+_DESCRIPTION_HEADER_ALIASES = frozenset(
+    _normalise_header(alias)
+    for alias in (
         "hata başlıkları",
         "hatabaşlıkları",
         "hata açıklaması",
@@ -1356,55 +1563,88 @@ async def upload_chaser_codes(file: UploadFile = File(...)) -> Dict[str, Any]:
         "description",
         "error description",
         "error titles",
-    }
-    normalised_description_headers = {_normalise_header(alias) for alias in description_headers}
+    )
+)
 
-    for row_index, row in enumerate(sheet.iter_rows(min_row=1, max_row=sheet.max_row, values_only=True), start=1):
-        for column_index, cell in enumerate(row, start=1):
-            if isinstance(cell, str):
-                candidate = _normalise_header(cell)
-                if target_column is None and candidate in normalised_aliases:
-                    target_column = column_index
-                    header_row_index = row_index
-                if description_column is None and candidate in normalised_description_headers:
-                    description_column = column_index
-        if target_column is not None:
-            break
 
-    if target_column is None or header_row_index is None:
-        # Fallback: try first non-empty column if there is only one column with data
-        non_empty_columns = set()
-        for row in sheet.iter_rows(min_row=1, max_row=sheet.max_row, values_only=True):
-            for column_index, cell in enumerate(row, start=1):
-                if cell not in (None, "", " "):
-                    non_empty_columns.add(column_index)
-        if len(non_empty_columns) == 1:
-            target_column = non_empty_columns.pop()
-            header_row_index = 0
-        else:
-            raise HTTPException(status_code=400, detail="Excel dosyasında 'HATA KODLARI (hex)' başlığı bulunamadı.")
+def _extract_codes(sheet: Any) -> tuple[List[int], Dict[int, str], int]:
+    target_column: Optional[int] = None
+    description_column: Optional[int] = None
 
     codes: List[int] = []
     code_descriptions: Dict[int, str] = {}
     invalid_count = 0
 
-    for row_index in range(header_row_index + 1, sheet.max_row + 1):
-        value = sheet.cell(row=row_index, column=target_column).value
+    def _collect(row: Sequence[Any], column: int) -> None:
+        nonlocal invalid_count
+        value = row[column] if column < len(row) else None
         if value is None:
-            continue
+            return
         if isinstance(value, str) and not value.strip():
-            continue
+            return
         try:
             code_value = _parse_code_value(value)
         except ValueError:
             invalid_count += 1
-            continue
+            return
         codes.append(code_value)
-        if description_column is not None and row_index <= sheet.max_row:
-            description_raw = sheet.cell(row=row_index, column=description_column).value
+        if description_column is not None and description_column < len(row):
+            description_raw = row[description_column]
             if isinstance(description_raw, str) and description_raw.strip():
                 code_descriptions[code_value] = description_raw.strip()
 
+    # Rows seen before a header is found; they become data if the single-column fallback applies.
+    headerless_rows: List[Sequence[Any]] = []
+    non_empty_columns: set[int] = set()
+
+    header_row_index = 0
+    for header_row_index, row in enumerate(sheet.iter_rows(values_only=True), start=1):
+        for column_index, cell in enumerate(row):
+            if isinstance(cell, str):
+                candidate = _normalise_header(cell)
+                if target_column is None and candidate in _CODE_HEADER_ALIASES:
+                    target_column = column_index
+                if description_column is None and candidate in _DESCRIPTION_HEADER_ALIASES:
+                    description_column = column_index
+            if cell not in (None, "", " "):
+                non_empty_columns.add(column_index)
+        if target_column is not None:
+            break
+        headerless_rows.append(row)
+
+    if target_column is None:
+        # Fallback: try first non-empty column if there is only one column with data
+        if len(non_empty_columns) != 1:
+            raise HTTPException(status_code=400, detail="Excel dosyasında 'HATA KODLARI (hex)' başlığı bulunamadı.")
+        target_column = non_empty_columns.pop()
+        for row in headerless_rows:
+            _collect(row, target_column)
+    else:
+        # Only the code and description columns are materialised for the data rows.
+        used_columns = [target_column] if description_column is None else [target_column, description_column]
+        first_column, last_column = min(used_columns), max(used_columns)
+        target_column -= first_column
+        if description_column is not None:
+            description_column -= first_column
+        for row in sheet.iter_rows(
+            min_row=header_row_index + 1,
+            min_col=first_column + 1,
+            max_col=last_column + 1,
+            values_only=True,
+        ):
+            _collect(row, target_column)
+
+    return codes, code_descriptions, invalid_count
+
+
+@app.post("/api/messages/chaser/codes/upload")
+async def upload_chaser_codes(file: UploadFile = File(...)) -> Dict[str, Any]:
+    contents = await file.read()
+    if not contents:
+        raise HTTPException(status_code=400, detail="Excel dosyası boş olamaz.")
+
+    codes, code_descriptions, invalid_count = _read_code_sheet(contents)
+
     if not codes:
         raise HTTPException(status_code=400, detail="Excel dosyasında geçerli hata kodu bulunamadı.")
 
@@ -1440,92 +1680,7 @@ async def upload_chaser_codes_decimal(file: UploadFile = File(...)) -> Dict[str,
     if not contents:
         raise HTTPException(status_code=400, detail="Excel dosyası boş olamaz.")
 
-    try:
-        workbook = openpyxl.load_workbook(io.BytesIO(contents), data_only=True)
-    except Exception as exc:
-        logger.exception("Excel dosyası okunamadı: %s", exc)
-        raise HTTPException(status_code=400, detail="Excel dosyası okunamadı.")
-
-    sheet = workbook.active
-    header_aliases = {
-        "hata kodları (hex)",
-        "hata kodları hex",
-        "hata kodları",
-        "hatakodları(hex)",
-        "hatakodlari(hex)",
-        "error codes (hex)",
-        "error codes hex",
-        "error codes",
-        "errorcodes(hex)",
-        "errorcodes",
-    }
-
-    def _normalise_header(value: str) -> str:
-        compact = " ".join(value.strip().split())
-        normalized = unicodedata.normalize("NFKD", compact).lower()
-        return "".join(ch for ch in normalized if ch.isalnum())
-
-    normalised_aliases = {_normalise_header(alias) for alias in header_aliases}
-
-    target_column: Optional[int] = None
-    header_row_index: Optional[int] = None
-    description_column: Optional[int] = None
-    description_headers = {
-        "hata başlıkları",
-        "hatabaşlıkları",
-        "hata açıklaması",
-        "hata aciklamasi",
-        "description",
-        "error description",
-        "error titles",
-    }
-    normalised_description_headers = {_normalise_header(alias) for alias in description_headers}
-
-    for row_index, row in enumerate(sheet.iter_rows(min_row=1, max_row=sheet.max_row, values_only=True), start=1):
-        for column_index, cell in enumerate(row, start=1):
-            if isinstance(cell, str):
-                candidate = _normalise_header(cell)
-                if target_column is None and candidate in normalised_aliases:
-                    target_column = column_index
-                    header_row_index = row_index
-                if description_column is None and candidate in normalised_description_headers:
-                    description_column = column_index
-        if target_column is not None:
-            break
-
-    if target_column is None or header_row_index is None:
-        # Fallback: try first non-empty column if there is only one column with data
-        non_empty_columns = set()
-        for row in sheet.iter_rows(min_row=1, max_row=sheet.max_row, values_only=True):
-            for column_index, cell in enumerate(row, start=1):
-                if cell not in (None, "", " "):
-                    non_empty_columns.add(column_index)
-        if len(non_empty_columns) == 1:
-            target_column = non_empty_columns.pop()
-            header_row_index = 0
-        else:
-            raise HTTPException(status_code=400, detail="Excel dosyasında 'HATA KODLARI (hex)' başlığı bulunamadı.")
-
-    codes: List[int] = []
-    code_descriptions: Dict[int, str] = {}
-    invalid_count = 0
-
-    for row_index in range(header_row_index + 1, sheet.max_row + 1):
-        value = sheet.cell(row=row_index, column=target_column).value
-        if value is None:
-            continue
-        if isinstance(value, str) and not value.strip():
-            continue
-        try:
-            code_value = _parse_code_value(value)
-        except ValueError:
-            invalid_count += 1
-            continue
-        codes.append(code_value)
-        if description_column is not None and row_index <= sheet.max_row:
-            description_raw = sheet.cell(row=row_index, column=description_column).value
-            if isinstance(description_raw, str) and description_raw.strip():
-                code_descriptions[code_value] = description_raw.strip()
+    codes, code_descriptions, invalid_count = _read_code_sheet(contents)
 
     if not codes:
         raise HTTPException(status_code=400, detail="Excel dosyasında geçerli hata kodu bulunamadı.")
@@ -1557,15 +1712,17 @@ async def start_signal_chaser(request: SignalChaserStartRequest) -> Dict[str, An
         raise HTTPException(status_code=400, detail="Önce bir DBC dosyası yükleyin.")
     try:
         if request.mode == "codes":
-            codes: List[int] = []
+            codes: Sequence[int] = []
             description_map: Dict[int, str] = {}
 
             if request.codes:
+                parsed_codes: List[int] = []
                 for raw in request.codes:
                     try:
-                        codes.append(_parse_code_value(raw))
+                        parsed_codes.append(_parse_code_value(raw))
                     except ValueError as exc:
                         raise HTTPException(status_code=400, detail=str(exc)) from exc
+                codes = parsed_codes
             elif request.code_range_start is not None and request.code_range_end is not None:
                 try:
                     range_start = _parse_code_value(request.code_range_start)
@@ -1580,7 +1737,8 @@ async def start_signal_chaser(request: SignalChaserStartRequest) -> Dict[str, An
                         status_code=400,
                         detail=f"En fazla {SignalChaserManager.MAX_CODES} kod gönderilebilir. Lütfen aralığı daraltın.",
                     )
-                codes = [range_start + offset for offset in range(range_size)]
+                # Kept as a range: it is consumed once by the scan and membership checks are O(1).
+                codes = range(range_start, range_end + 1)
             else:
                 raise HTTPException(status_code=400, detail="Excel ya da manuel kod seçeneği belirlenmedi.")
 
@@ -1667,19 +1825,23 @@ async def get_fault_injection_status(message_name: Optional[str] = Query(default
     return {"tasks": tasks}
 
 
-@app.get("/api/logs")
-async def list_logs() -> Dict[str, Any]:
-    logs = recording_manager.list_recordings()
-    active = recording_manager.get_active()
-    if active:
-        active["duration"] = max(0.0, time.time() - active["started_at"])
-    return {"active": active, "logs": logs}
+@app.get("/api/logs", response_class=AppJSONResponse)
+async def list_logs() -> AppJSONResponse:
+    return AppJSONResponse({"active": recording_manager.get_active(), "logs": recording_manager.list_recordings()})
+
+
+_RECORDING_SUMMARY_FIELDS = ("id", "name", "started_at", "ended_at", "event_count")
+
+
+def _recording_summary(info: Dict[str, Any]) -> Dict[str, Any]:
+    # A stopped recording carries every event; clients only need to know which recording it was.
+    return {field: info[field] for field in _RECORDING_SUMMARY_FIELDS if field in info}
 
 
 @app.post("/api/logs/start")
 async def start_log(request: RecordingStartRequest) -> Dict[str, Any]:
     try:
-        info = recording_manager.start(request.name)
+        info = _recording_summary(recording_manager.start(request.name))
         broadcaster.send_threadsafe({"type": "recording", "state": "started", "record": info})
         return info
     except RuntimeError as exc:
@@ -1689,150 +1851,169 @@ async def start_log(request: RecordingStartRequest) -> Dict[str, Any]:
 @app.post("/api/logs/stop")
 async def stop_log() -> Dict[str, Any]:
     try:
-        info = recording_manager.stop()
+        info = _recording_summary(await run_in_threadpool(recording_manager.stop))
         broadcaster.send_threadsafe({"type": "recording", "state": "stopped", "record": info})
         return info
     except RuntimeError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
 
-@app.get("/api/logs/{log_id}")
-async def get_log(log_id: str) -> Dict[str, Any]:
-    data = recording_manager.get_recording(log_id)
+@app.get("/api/logs/{log_id}", response_class=AppJSONResponse)
+async def get_log(log_id: str) -> AppJSONResponse:
+    data = await run_in_threadpool(recording_manager.get_recording, log_id)
     if data is None:
         raise HTTPException(status_code=404, detail="Kayıt bulunamadı.")
-    return data
+    return AppJSONResponse(data)
+
+
+async def _decode_events_parallel(
+    temp_manager: DBCManager,
+    signal_catalog: Dict[tuple[str, str], Dict[str, Any]],
+    contents: bytes,
+    digest: bytes,
+    label: Optional[str],
+    events: List[Dict[str, Any]],
+    started_at: float,
+    max_events: int,
+    max_points: int,
+) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]], float]:
+    """Decode contiguous event chunks in worker processes and stitch the results back in order."""
+    loop = asyncio.get_running_loop()
+    pool = get_pool((digest, temp_manager, signal_catalog))
+    # Forked workers already hold the parsed DBC; only spawned ones need the raw bytes.
+    payload = None if pool_shares_dbc(digest) else contents
+    chunks = split_chunks(events, WORKER_COUNT)
+    try:
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    pool,
+                    decode_chunk,
+                    payload,
+                    digest,
+                    label,
+                    chunk,
+                    started_at,
+                    max(0, max_events - offset),
+                )
+                for offset, chunk in chunks
+            )
+        )
+    except BrokenProcessPool:
+        # A worker died mid-decode; drop the pool so the next decode gets a fresh one, and
+        # finish this one in place rather than failing the request.
+        logger.warning("Decode worker pool broke; decoding %d events in place.", len(events))
+        shutdown_pool()
+        return await run_in_threadpool(
+            _decode_in_place, temp_manager, signal_catalog, events, started_at, max_events, max_points
+        )
+
+    decoded_events: List[Dict[str, Any]] = []
+    series_map: Dict[str, Dict[str, Any]] = {}
+    last_timestamp = started_at
+    for chunk_events, chunk_series, chunk_last in results:
+        decoded_events.extend(chunk_events)
+        merge_series(series_map, chunk_series)
+        last_timestamp = max(last_timestamp, chunk_last)
+    series = await run_in_threadpool(downsample_series, series_map, max_points)
+    return decoded_events, series, last_timestamp
+
+
+def _decode_in_place(
+    temp_manager: DBCManager,
+    signal_catalog: Dict[tuple[str, str], Dict[str, Any]],
+    events: List[Dict[str, Any]],
+    started_at: float,
+    max_events: int,
+    max_points: int,
+) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]], float]:
+    decoded_events, series_map, last_timestamp = decode_events(
+        temp_manager, signal_catalog, events, started_at, max_events
+    )
+    return decoded_events, downsample_series(series_map, max_points), last_timestamp
+
+
+# Decoded event rows serialised per streamed body chunk.
+DECODE_STREAM_BATCH = 256
 
 
 @app.post("/api/logs/{log_id}/decode")
-async def decode_log(log_id: str, file: UploadFile = File(...)) -> Dict[str, Any]:
-    data = recording_manager.get_recording(log_id)
-    if data is None:
+async def decode_log(log_id: str, file: UploadFile = File(...)) -> StreamingResponse:
+    # Reading the recording, parsing the DBC and decoding all run off the event loop, so
+    # live traffic keeps flowing to WebSocket clients while a large log is decoded.
+    if not recording_manager.has_recording(log_id):
         raise HTTPException(status_code=404, detail="Kayıt bulunamadı.")
 
     contents = await file.read()
-    temp_manager = DBCManager()
+    # Parsed DBCs are cached and shared with decode workers by this content digest.
+    digest = hashlib.blake2b(contents, digest_size=16).digest()
     try:
-        temp_manager.load_from_content(contents, file.filename)
+        temp_manager, metadata, signal_catalog = await run_in_threadpool(
+            load_parsed_dbc, contents, digest, file.filename
+        )
     except Exception as exc:  # pragma: no cover - depends on cantools
         raise HTTPException(status_code=400, detail=f"DBC yüklenemedi: {exc}")
 
-    try:
-        metadata = temp_manager.list_messages()
-    except Exception as exc:
-        raise HTTPException(status_code=400, detail=f"DBC mesajları okunamadı: {exc}")
+    if WORKER_COUNT >= PARALLEL_MIN_WORKERS:
+        # Forked workers keep a copy-on-write snapshot of the parent's heap for their lifetime,
+        # so the pool is started (or reused) while that heap holds the parsed DBC but not yet
+        # the recording.
+        await asyncio.wrap_future(get_pool((digest, temp_manager, signal_catalog)).submit(pool_ready))
 
-    signal_catalog: Dict[tuple[str, str], Dict[str, Any]] = {}
-    for message in metadata.get("messages", []):
-        for signal in message.get("signals", []):
-            signal_catalog[(message["name"], signal["name"])] = signal
+    data = await run_in_threadpool(recording_manager.get_recording, log_id)
+    if data is None:
+        raise HTTPException(status_code=404, detail="Kayıt bulunamadı.")
 
     started_at = data.get("started_at", 0.0)
     events = data.get("events", [])
-    decoded_events: list[Dict[str, Any]] = []
     events_total = len(events)
     max_events = 2000
     max_points = 5000
-    series_map: Dict[str, Dict[str, Any]] = {}
 
-    for event in events:
-        event_timestamp = float(event.get("timestamp", started_at))
-        relative_time = event_timestamp - started_at
-        decoded_payload: Optional[Dict[str, Any]] = None
-        data_bytes = bytes(event.get("data", []))
-        try:
-            decoded_payload = temp_manager.decode(event.get("id", 0), data_bytes)
-        except Exception:
-            decoded_payload = None
+    # Decode and downsample before the response starts, off the event loop, so a failure is
+    # still reported as an HTTP error rather than a truncated JSON body.
+    if WORKER_COUNT >= PARALLEL_MIN_WORKERS and events_total >= PARALLEL_MIN_EVENTS:
+        decoded_events, series, last_timestamp = await _decode_events_parallel(
+            temp_manager, signal_catalog, contents, digest, file.filename, events, started_at, max_events, max_points
+        )
+    else:
+        decoded_events, series, last_timestamp = await run_in_threadpool(
+            _decode_in_place, temp_manager, signal_catalog, events, started_at, max_events, max_points
+        )
 
-        if decoded_payload is None and event.get("message"):
-            try:
-                message_obj = temp_manager.get_message_by_name(event["message"])
-                decoded_signals = message_obj.decode(data_bytes)
-                decoded_payload = {
-                    "name": message_obj.name,
-                    "signals": decoded_signals,
-                    "is_extended": message_obj.is_extended_frame,
-                    "comment": message_obj.comment,
-                }
-            except Exception:
-                decoded_payload = None
-
-        if decoded_payload and decoded_payload.get("name"):
-            message_name = decoded_payload["name"]
-            signals = decoded_payload.get("signals", {})
-            for signal_name, value in signals.items():
-                key = f"{message_name}.{signal_name}"
-                entry = series_map.setdefault(
-                    key,
-                    {
-                        "key": key,
-                        "message": message_name,
-                        "signal": signal_name,
-                        "unit": signal_catalog.get((message_name, signal_name), {}).get("unit"),
-                        "points": [],
-                    },
-                )
-                numeric_value: Optional[float]
-                if isinstance(value, bool):
-                    numeric_value = float(int(value))
-                elif isinstance(value, (int, float)):
-                    numeric_value = float(value)
-                else:
-                    numeric_value = None
-                if numeric_value is not None:
-                    entry["points"].append({"timestamp": event_timestamp, "relative": relative_time, "value": numeric_value})
+    messages_meta = build_messages_meta(metadata)
+    log_info = {
+        "id": data.get("id"),
+        "name": data.get("name"),
+        "started_at": started_at,
+        "ended_at": data.get("ended_at"),
+        "duration": max(0.0, last_timestamp - started_at),
+        "event_count": events_total,
+    }
 
-        if len(decoded_events) < max_events:
-            decoded_events.append(
-                {
-                    "type": event.get("type"),
-                    "timestamp": event_timestamp,
-                    "relative_time": relative_time,
-                    "id": event.get("id"),
-                    "dlc": event.get("dlc"),
-                    "data": event.get("data"),
-                    "message": event.get("message"),
-                    "decoded": decoded_payload,
-                    "periodMs": event.get("periodMs"),
-                }
-            )
+    async def body() -> AsyncIterator[bytes]:
+        # Rows and series are serialised piece by piece, so the whole JSON document never sits
+        # in memory next to the decoded result.
+        yield b'{"log":' + _dumps(log_info) + b',"messages_meta":' + _dumps(messages_meta) + b',"events":['
+        for offset in range(0, len(decoded_events), DECODE_STREAM_BATCH):
+            rows = b",".join(_dumps(row) for row in decoded_events[offset : offset + DECODE_STREAM_BATCH])
+            yield rows if offset == 0 else b"," + rows
+        yield b'],"events_shown":%d,"events_total":%d,"series":[' % (len(decoded_events), events_total)
+        for index, entry in enumerate(series):
+            chunk = _dumps(entry)
+            yield chunk if index == 0 else b"," + chunk
+        yield b"]}"
 
-    series = sorted(series_map.values(), key=lambda item: item["key"])
-    for entry in series:
-        points = entry.get("points", [])
-        original_count = len(points)
-        if original_count > max_points:
-            step = max(1, math.ceil(original_count / max_points))
-            entry["points"] = points[::step]
-            entry["downsampled"] = True
-            entry["original_points"] = original_count
-        else:
-            entry["downsampled"] = False
-            entry["original_points"] = original_count
-    duration = 0.0
-    if events:
-        last_timestamp = max(float(e.get("timestamp", started_at)) for e in events)
-        duration = max(0.0, last_timestamp - started_at)
+    return StreamingResponse(body(), media_type="application/json")
 
-    return {
-        "log": {
-            "id": data.get("id"),
-            "name": data.get("name"),
-            "started_at": started_at,
-            "ended_at": data.get("ended_at"),
-            "duration": duration,
-            "event_count": len(events),
-        },
-        "events": decoded_events,
-        "events_shown": len(decoded_events),
-        "events_total": events_total,
-        "series": series,
-    }
 
+@app.post("/api/messages/send", response_class=AppJSONResponse)
+async def send_message(http_request: Request) -> AppJSONResponse:
+    try:
+        request = MessageSendRequest.from_payload(orjson.loads(await http_request.body()))
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
 
-@app.post("/api/messages/send")
-async def send_message(request: MessageSendRequest) -> JSONResponse:
     if not dbc_manager.is_loaded():
         raise HTTPException(status_code=400, detail="DBC file must be loaded before sending messages.")
 
@@ -1850,11 +2031,11 @@ async def send_message(request: MessageSendRequest) -> JSONResponse:
             task_key = request.task_key or request.message_name
             can_manager.start_periodic(task_key, message, period_seconds)
             _handle_tx_event(request.message_name, encoded, task_key=task_key, period_ms=period_ms)
-            return JSONResponse({"status": "periodic", "taskKey": task_key, "periodMs": period_ms})
+            return AppJSONResponse({"status": "periodic", "taskKey": task_key, "periodMs": period_ms})
 
         can_manager.send(message)
         _handle_tx_event(request.message_name, encoded)
-        return JSONResponse({"status": "sent"})
+        return AppJSONResponse({"status": "sent"})
 
     except CANNotConfiguredError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
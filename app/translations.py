@@ -1,8 +1,9 @@
 """Translation management for CAN Bus Tester."""
 
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
-TRANSLATIONS: Dict[str, Dict[str, Any]] = {
+_TRANSLATIONS: Dict[str, Dict[str, Any]] = {
     "tr": {
         # General
         "app_title": "CAN Bus Tester",
@@ -340,11 +341,17 @@ TRANSLATIONS: Dict[str, Dict[str, Any]] = {
 }
 
 
+# Read-only views, so a language map handed out by reference cannot be altered for every caller.
+TRANSLATIONS: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {lang: MappingProxyType(entries) for lang, entries in _TRANSLATIONS.items()}
+)
+
+
 def get_translation(lang: str, key: str, default: str = "") -> str:
     """Get translation for a specific key and language."""
-    return TRANSLATIONS.get(lang, {}).get(key, default or key)
+    return get_all_translations(lang).get(key, default or key)
 
 
-def get_all_translations(lang: str) -> Dict[str, str]:
+def get_all_translations(lang: str) -> Mapping[str, str]:
     """Get all translations for a specific language."""
-    return TRANSLATIONS.get(lang, TRANSLATIONS["en"])
+    return TRANSLATIONS.get(lang) or TRANSLATIONS["en"]
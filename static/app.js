@@ -1010,6 +1010,13 @@ function formatFaultType(faultType) {
     return types[faultType] || faultType;
 }
 
+function formatHexData(data) {
+    if (typeof data === "string") {
+        return (data.match(/.{1,2}/g) || []).join(" ").toUpperCase();
+    }
+    return (data || []).map((byte) => byte.toString(16).padStart(2, "0").toUpperCase()).join(" ");
+}
+
 function renderMonitor() {
     monitorLog.innerHTML = "";
     for (const entry of state.monitorEntries) {
@@ -1026,7 +1033,7 @@ function renderMonitor() {
         container.append(idLine);
 
         const dataLine = document.createElement("span");
-        const hexData = entry.data.map((byte) => byte.toString(16).padStart(2, "0").toUpperCase()).join(" ");
+        const hexData = formatHexData(entry.data);
         dataLine.textContent = `DATA: ${hexData}`;
         container.append(dataLine);
 
@@ -1622,9 +1629,25 @@ function handleSocketEvent(event) {
     }
 }
 
+const socketDecoder = new TextDecoder();
+
+function expandColumnarBatch(batch) {
+    const fields = Object.keys(batch.columns);
+    const messages = new Array(batch.count);
+    for (let index = 0; index < batch.count; index += 1) {
+        const message = {};
+        for (const field of fields) {
+            message[field] = batch.columns[field][index];
+        }
+        messages[index] = message;
+    }
+    return messages;
+}
+
 function connectWebSocket() {
     const protocol = window.location.protocol === "https:" ? "wss" : "ws";
     const ws = new WebSocket(`${protocol}://${window.location.host}/ws`);
+    ws.binaryType = "arraybuffer";
 
     ws.onopen = () => {
         console.info(t('websocket_opened'));
@@ -1633,9 +1656,11 @@ function connectWebSocket() {
 
     ws.onmessage = (event) => {
         try {
-            const data = JSON.parse(event.data);
-            if (data.type === "batch" && Array.isArray(data.messages)) {
-                for (const message of data.messages) {
+            const raw = typeof event.data === "string" ? event.data : socketDecoder.decode(event.data);
+            const data = JSON.parse(raw);
+            if (data.type === "batch" && (data.columns || Array.isArray(data.messages))) {
+                const messages = data.columns ? expandColumnarBatch(data) : data.messages;
+                for (const message of messages) {
                     handleSocketEvent(message);
                 }
             } else {
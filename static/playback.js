@@ -173,7 +173,7 @@ function renderSignalList() {
         element.innerHTML = `
             <strong>${item.message}</strong>
             <span>${item.signal}${item.unit ? ` (${item.unit})` : ""}</span>
-            <span class="signal-item__meta">${item.points.length} örnek${item.downsampled ? " • örnekleme" : ""}</span>
+            <span class="signal-item__meta">${item.values.length} örnek${item.downsampled ? " • örnekleme" : ""}</span>
         `;
         element.addEventListener("click", () => {
             state.selectedSeriesKey = item.key;
@@ -188,7 +188,7 @@ function renderSignalList() {
 function renderChartForSeries(seriesItem) {
     ensureChart();
     if (!state.chart) return;
-    if (!seriesItem || !seriesItem.points.length) {
+    if (!seriesItem || !seriesItem.values.length) {
         state.chart.data.datasets = [];
         state.chart.update();
         if (signalDetails) {
@@ -197,9 +197,9 @@ function renderChartForSeries(seriesItem) {
         return;
     }
 
-    const dataPoints = seriesItem.points.map((point) => ({
-        x: point.relative ?? (point.timestamp - (state.decodedData?.log?.started_at || 0)),
-        y: point.value,
+    const dataPoints = seriesItem.values.map((value, index) => ({
+        x: seriesItem.relative[index] ?? (seriesItem.timestamps[index] - (state.decodedData?.log?.started_at || 0)),
+        y: value,
     }));
 
     state.chart.data.datasets = [
@@ -232,6 +232,13 @@ function renderChartForSeries(seriesItem) {
     }
 }
 
+function formatHexData(data) {
+    if (typeof data === "string") {
+        return (data.match(/.{1,2}/g) || []).join(" ").toUpperCase();
+    }
+    return (data || []).map((byte) => byte.toString(16).padStart(2, "0").toUpperCase()).join(" ");
+}
+
 function renderEventTable(events) {
     if (!eventTable) return;
     eventTable.innerHTML = "";
@@ -276,8 +283,7 @@ function renderEventTable(events) {
         const nameCell = document.createElement("td");
         nameCell.textContent = event.decoded?.name || event.message || "-";
         const dataCell = document.createElement("td");
-        const dataArray = event.data || [];
-        dataCell.textContent = dataArray.map((byte) => byte.toString(16).padStart(2, "0").toUpperCase()).join(" ");
+        dataCell.textContent = formatHexData(event.data);
         row.append(timeCell, typeCell, idCell, nameCell, dataCell);
         tbody.append(row);
     }